@@ -6,7 +6,7 @@ QUEUE_FILE="$HOME/.claude/productivity/prompt_queue.json"
 
 if [ -f "$QUEUE_FILE" ]; then
     PROMPTS=$(python3 -c "
-import json
+import json, os
 try:
     with open('$QUEUE_FILE') as f:
         q = json.load(f)
@@ -14,8 +14,11 @@ try:
     if undelivered:
         for e in undelivered:
             e['delivered'] = True
-        with open('$QUEUE_FILE', 'w') as f:
-            json.dump(q, f)
+        # Write-then-rename so the timer never reads a half-written queue.
+        tmp = '$QUEUE_FILE.hook.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(q, f, separators=(',', ':'))
+        os.replace(tmp, '$QUEUE_FILE')
         msgs = [f\"[{e['type']}] {e['prompt']}\" for e in undelivered]
         print(' | '.join(msgs))
 except Exception:
@@ -4,7 +4,6 @@ Adapter for Claude Code (Clawed).
 Formats prompts for Clawed's hook injection system.
 """
 
-import fcntl
 import json
 import os
 import sys
@@ -22,6 +21,13 @@ class ClaudeAdapter:
         self.ack_file = os.path.join(self.base_dir, "acknowledged.txt")
         self.session_file = os.path.join(self.base_dir, "session.yaml")
         self.chore_timers_file = os.path.join(self.base_dir, "chore_timers.yaml")
+        # Next queue id. Only this process appends, so it is derived from the file
+        # once and counted in memory after that.
+        self._next_id = None
+        # ((st_mtime_ns, st_size) of the queue file, {type: undelivered count}).
+        # The hook/plugin marks entries delivered by rewriting the file, which
+        # changes the key.
+        self._undelivered = (None, {})
 
     def _substitute(self, text):
         """Replace agent-specific placeholders. Core uses <ack_file>, <tool_name>,
@@ -34,22 +40,22 @@ class ClaudeAdapter:
                 .replace("<chore_timers_file>", self.chore_timers_file))
 
     def _load_queue(self):
-        if not os.path.exists(self.queue_file):
-            return []
-        with open(self.queue_file, "r") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
+        # No lock: every writer (_save_queue here, pomodoro-hook.sh) replaces the
+        # file by rename, so a reader sees either the old or the new queue.
+        try:
+            with open(self.queue_file, "r") as f:
                 return json.load(f)
-            except json.JSONDecodeError:
-                return []
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
 
     def _save_queue(self, queue):
+        # Invariant: queue_file is always a complete JSON document, because every
+        # write lands in a tmp file in the same directory and is renamed over it.
+        # That is what lets _load_queue read without a lock.
         tmp = self.queue_file + ".tmp"
         with open(tmp, "w") as f:
-            json.dump(queue, f, indent=2)
-        os.rename(tmp, self.queue_file)
+            json.dump(queue, f, separators=(",", ":"))
+        os.replace(tmp, self.queue_file)
 
     def _map_to_hook_events(self, prompt_type):
         """Map prompt type to Clawed hook event names.
@@ -77,7 +83,13 @@ class ClaudeAdapter:
         """Append prompt to queue for the hook to surface on next fire."""
         text = self._substitute(prompt_text)
         queue = self._load_queue()
-        nid = max((e["id"] for e in queue), default=0) + 1
+        if self._next_id is None:
+            self._next_id = max((e["id"] for e in queue), default=0) + 1
+        # Delivered entries have been surfaced and nothing reads them again; drop
+        # them here so the queue stays bounded over a long session.
+        queue = [e for e in queue if not e.get("delivered")]
+        nid = self._next_id
+        self._next_id += 1
         queue.append({
             "id": nid,
             "timestamp": datetime.now().isoformat(),
@@ -90,12 +102,23 @@ class ClaudeAdapter:
 
     def has_undelivered(self, prompt_type):
         """Return True if any undelivered entry of this type exists in queue."""
-        queue = self._load_queue()
-        return any(e["type"] == prompt_type and not e.get("delivered") for e in queue)
+        try:
+            st = os.stat(self.queue_file)
+        except FileNotFoundError:
+            return False
+        key = (st.st_mtime_ns, st.st_size)
+        if self._undelivered[0] != key:
+            counts = {}
+            for e in self._load_queue():
+                if not e.get("delivered"):
+                    counts[e["type"]] = counts.get(e["type"], 0) + 1
+            self._undelivered = (key, counts)
+        return self._undelivered[1].get(prompt_type, 0) > 0
 
     def clear(self):
         """Clear all entries from queue."""
         self._save_queue([])
+        self._next_id = 1
 
 
 def main():
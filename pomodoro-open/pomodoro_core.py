@@ -5,19 +5,52 @@ Calls adapter for agent-specific behavior: surface_prompt, notify.
 """
 
 import asyncio
+import copy
+import ctypes
+import functools
+import math
 import os
 import re
 import shutil
+import struct
 import subprocess
+import sys
 from datetime import datetime, timedelta
 import yaml
 
+try:
+    # libyaml-backed loader/dumper: same safe semantics, parsing and emitting in C.
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    # PyYAML built without libyaml — fall back to the pure-Python implementations.
+    from yaml import SafeLoader, SafeDumper
+
 
 # Set POMODORO_DEBUG=1 to print "[Sending notification: ...]" lines on every
 # notify-send call. Off by default to keep the timer terminal clean. Failures
-# always print regardless.
+# to launch notify-send always print regardless.
 DEBUG = os.environ.get('POMODORO_DEBUG', '').lower() in ('1', 'true', 'yes')
 
+# Separators ignored when matching task names (whitespace, hyphen, en/em dash,
+# underscore). Compiled once; normalize() runs on every ack and task switch.
+_TASK_NAME_SEPARATORS = re.compile(r'[\s\-\u2013\u2014_]+')
+
+# Timestamp formats accepted in the data files (user-facing first, then ISO).
+_TS_FORMATS = ('%d/%m/%Y %H:%M', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f')
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_ts_str(value):
+    """strptime against _TS_FORMATS, memoized: the same end_time / start_time /
+    due_at strings are re-parsed on every monitor pass, and strptime is pure
+    Python. Failures raise and are not cached."""
+    for fmt in _TS_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Can't parse: {value!r}")
+
 
 def create_config(base_dir, adapter):
     if base_dir is None:
@@ -67,12 +100,115 @@ END_SESSION_TEMPLATE = (
 )
 
 
+# === FILE WATCHING ===
+
+class DirWatcher:
+    """inotify watch on the data dir, driven by the asyncio loop.
+
+    Lets a coroutine sleep until a named file is written (IN_CLOSE_WRITE) or
+    renamed into place (IN_MOVED_TO) instead of stat-polling it every second.
+    Where inotify is unavailable (non-Linux, or the syscall fails), `available`
+    is False and wait() degrades to a plain sleep: at most poll_interval for
+    callers that stat-poll a file on wake, or the full timeout with poll=False
+    for callers that only want a timer.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len; name follows
+
+    def __init__(self, path, poll_interval):
+        self.poll_interval = poll_interval
+        self.fd = None
+        self._waiters = []
+        self._reading = False
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+            if fd < 0:
+                return
+            if libc.inotify_add_watch(fd, os.fsencode(path), self.IN_CLOSE_WRITE | self.IN_MOVED_TO) < 0:
+                os.close(fd)
+                return
+            self.fd = fd
+        except (OSError, AttributeError):
+            pass
+
+    @property
+    def available(self):
+        return self.fd is not None
+
+    def _on_readable(self):
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            i = 0
+            while i + self.EVENT_HEADER.size <= len(buf):
+                _wd, _mask, _cookie, length = self.EVENT_HEADER.unpack_from(buf, i)
+                i += self.EVENT_HEADER.size
+                changed.add(os.fsdecode(buf[i:i + length].rstrip(b'\0')))
+                i += length
+        for names, fut in self._waiters:
+            if not fut.done() and names & changed:
+                fut.set_result(True)
+
+    async def wait(self, names, timeout=None, poll=True):
+        """Wait until one of `names` (basenames in the watched dir) changes.
+        Returns True on a change, False on timeout. Without inotify, sleeps
+        min(timeout, poll_interval) -- or the whole timeout when poll is False --
+        and returns False."""
+        if not self.available:
+            if poll or timeout is None:
+                timeout = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+            await asyncio.sleep(timeout)
+            return False
+        loop = asyncio.get_running_loop()
+        if not self._reading:
+            loop.add_reader(self.fd, self._on_readable)
+            self._reading = True
+        entry = (frozenset(names), loop.create_future())
+        self._waiters.append(entry)
+        try:
+            return await asyncio.wait_for(entry[1], timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters.remove(entry)
+
+
 class PomodoroCore:
     """All pomodoro logic - calls adapter for agent-specific behavior."""
     
     def __init__(self, config):
         self.config = config
         self.adapter = config['adapter']
+        # path -> ((st_mtime_ns, st_size), parsed data). See _load_yaml_cached.
+        self._yaml_cache = {}
+        # ((st_mtime_ns, st_size) of tasks.yaml, {normalized name: (name, type)}).
+        self._task_types = (None, {})
+        # (start_time string, parsed datetime). start_time changes once per session.
+        self._start_dt = (None, None)
+        # ((date, st_mtime_ns, st_size) of reminders.yaml, today's sorted schedule).
+        self._reminder_schedule = (None, [])
+        self._watcher = None
+        # gi.repository.Notify module once probed; False if unavailable.
+        self._libnotify = None
+        # Absolute path of notify-send, resolved on first fallback use; False if missing.
+        self._notify_send = None
+
+    def dir_watcher(self):
+        """Shared DirWatcher on the data dir, created on first use."""
+        if self._watcher is None:
+            self._watcher = DirWatcher(os.path.dirname(self.config['ACK_FILE']),
+                                       self.config['POLL_INTERVAL'])
+        return self._watcher
 
     # === DEBUG ===
 
@@ -95,74 +231,155 @@ class PomodoroCore:
         else:
             self._default_notify(title, message)
 
+    def _load_libnotify(self):
+        """Return gi.repository.Notify, initialised, or None when PyGObject or the
+        libnotify typelib isn't installed. Probed once per process."""
+        if self._libnotify is None:
+            self._libnotify = False
+            try:
+                import gi
+                gi.require_version('Notify', '0.7')
+                from gi.repository import Notify
+                if Notify.init('Pomodoro'):
+                    self._libnotify = Notify
+            except (ImportError, ValueError):
+                pass
+        return self._libnotify or None
+
     def _default_notify(self, title, message):
-        """Default notification via notify-send. Success print is gated behind
-        POMODORO_DEBUG; failures and errors always surface."""
+        """Default notification. Uses libnotify in-process over D-Bus when
+        PyGObject is available (no process spawn), else notify-send,
+        fire-and-forget: the timer loop never blocks on the child or drains its
+        pipes. Success print is gated behind POMODORO_DEBUG; launch errors always
+        surface. notify-send is looked up on $PATH once, on first use, and spawned
+        by absolute path after that; if missing, that is reported once and further
+        notifications are skipped. notify-send's own exit status is not checked (a
+        missed popup is cosmetic)."""
         if DEBUG:
             print(f"  [Sending notification: {title} - {message}]")
+        notify_lib = self._load_libnotify()
+        if notify_lib:
+            try:
+                from gi.repository import GLib
+                n = notify_lib.Notification.new(title, message)
+                n.set_hint('sound-name', GLib.Variant.new_string('message-new-instant'))
+                n.show()
+                return
+            except Exception as e:
+                # show() is a blocking D-Bus call; after one failure don't pay for it
+                # again on every notification.
+                self._libnotify = False
+                self._dbg(f"  [libnotify failed, using notify-send from now on: {e}]")
+        if self._notify_send is None:
+            self._notify_send = shutil.which('notify-send') or False
+            if not self._notify_send:
+                print("  [notify-send not found; desktop notifications disabled.]")
+                print("  [Install libnotify (e.g., 'pacman -S libnotify' on Arch)]")
+        if not self._notify_send:
+            return
         try:
-            result = subprocess.run([
-                'notify-send',
+            subprocess.Popen([
+                self._notify_send,
                 '-h', 'string:sound-name:message-new-instant',
                 title, message
-            ], capture_output=True)
-            if result.returncode != 0:
-                print(f"  [Notification failed: {result.stderr.decode().strip()}]")
+            ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             print(f"  [Notification error: {e}]")
 
 # === SESSION/LOG ===
 
+    def _load_yaml_cached(self, path):
+        """Parse a YAML file, reusing the previous parse while its (mtime, size)
+        is unchanged. The agent edits these files too, so the in-memory copy is
+        only trusted until the file on disk changes. Returns a deep copy because
+        callers mutate what they load before saving it back."""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is None or cached[0] != key:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = (key, yaml.load(f, Loader=SafeLoader))
+            self._yaml_cache[path] = cached
+        return copy.deepcopy(cached[1])
+
+    def _write_yaml(self, path, data, **dump_opts):
+        """Serialize in memory, write to path.tmp in one call, then os.replace into
+        place so readers (the agent included) never see a half-written file. No
+        fsync: losing the last write on power loss is tolerable, a torn file is not.
+        Keys keep insertion order, task names stay literal UTF-8, and long strings
+        (prompts, notes) are not line-wrapped.
+
+        Skips the write entirely when data equals what the cache holds for the
+        file and the file is unchanged on disk since, e.g. clearing fields that
+        are already None."""
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[1] == data:
+            try:
+                st = os.stat(path)
+                if (st.st_mtime_ns, st.st_size) == cached[0]:
+                    return
+            except FileNotFoundError:
+                pass
+        text = yaml.dump(data, Dumper=SafeDumper, sort_keys=False, allow_unicode=True,
+                         width=1_000_000, **dump_opts)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+        # Seed the cache with what was just written so the next load is a stat
+        # rather than a reparse. Keyed on the tmp inode, which the rename keeps.
+        self._yaml_cache[path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data))
+
     def load_session(self):
-        with open(self.config['SESSION_FILE'], 'r') as f:
-            return yaml.safe_load(f)
+        return self._load_yaml_cached(self.config['SESSION_FILE'])
 
     def save_session(self, session):
-        sf = self.config['SESSION_FILE']
-        with open(sf + '.tmp', 'w') as f:
-            yaml.dump(session, f)
-        os.rename(sf + '.tmp', sf)
+        self._write_yaml(self.config['SESSION_FILE'], session)
 
     def load_log(self):
-        with open(self.config['LOG_FILE'], 'r') as f:
-            return yaml.safe_load(f) or {'projects': {}}
+        return self._load_yaml_cached(self.config['LOG_FILE']) or {'projects': {}}
 
     def save_log(self, log):
-        with open(self.config['LOG_FILE'], 'w') as f:
-            yaml.dump(log, f, default_flow_style=False)
+        self._write_yaml(self.config['LOG_FILE'], log, default_flow_style=False)
 
     def load_tasks(self):
-        with open(self.config['TASKS_FILE'], 'r') as f:
-            return yaml.safe_load(f)
+        return self._load_yaml_cached(self.config['TASKS_FILE'])
 
     # === HELPERS ===
 
     def normalize(self, name):
-        return re.sub(r'[\s\-\u2013\u2014_]+', '', name.lower())
+        return _TASK_NAME_SEPARATORS.sub('', name.lower())
+
+    def task_index(self):
+        """Map normalized task name -> (name, 'work' | 'fun'). Rebuilt only when
+        tasks.yaml changes on disk. First match wins, work_tasks before
+        fun_productive, same as the old linear scan."""
+        st = os.stat(self.config['TASKS_FILE'])
+        key = (st.st_mtime_ns, st.st_size)
+        if self._task_types[0] != key:
+            tasks = self.load_tasks()
+            index = {}
+            for category, task_type in (('work_tasks', 'work'), ('fun_productive', 'fun')):
+                for t in tasks.get(category, []):
+                    index.setdefault(self.normalize(t['name']), (t['name'], task_type))
+            self._task_types = (key, index)
+        return self._task_types[1]
 
     def find_task(self, task_name):
-        tasks = self.load_tasks()
-        norm = self.normalize(task_name)
-        for t in tasks.get('work_tasks', []):
-            if self.normalize(t['name']) == norm:
-                return t['name'], 'work'
-        for t in tasks.get('fun_productive', []):
-            if self.normalize(t['name']) == norm:
-                return t['name'], 'fun'
-        return None, None
-
-    def hours_elapsed(self, start):
+        return self.task_index().get(self.normalize(task_name), (None, None))
+
+    def hours_elapsed(self, start, now=None):
         if not start:
             return 0
-        return (datetime.now() - datetime.fromisoformat(start)).total_seconds() / 3600
+        if self._start_dt[0] != start:
+            self._start_dt = (start, datetime.fromisoformat(start))
+        return ((now or datetime.now()) - self._start_dt[1]).total_seconds() / 3600
 
     def parse_ts(self, value):
         if isinstance(value, str):
-            for fmt in ('%d/%m/%Y %H:%M', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f'):
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
+            return _parse_ts_str(value)
         raise ValueError(f"Can't parse: {value!r}")
 
     def fmt_ts(self, dt):
@@ -203,6 +420,8 @@ class PomodoroCore:
 
     # === ACK ===
 
+    BARE_ACK_ACTIONS = frozenset({'end', 'break', 'extend'})
+
     def parse_ack(self, content):
         """Parse ack content with full error handling.
 
@@ -217,12 +436,8 @@ class PomodoroCore:
         transition, etc.). The legacy 'continue' tokens are explicitly rejected
         with a vocabulary-update prompt.
         """
-        if content == "end":
-            return {"action": "end"}
-        if content == "break":
-            return {"action": "break"}
-        if content == "extend":
-            return {"action": "extend"}
+        if content in self.BARE_ACK_ACTIONS:
+            return {"action": content}
 
         # Reject legacy 'continue' / 'continue:Task' explicitly.
         if content == "continue" or content.startswith("continue:"):
@@ -234,30 +449,26 @@ class PomodoroCore:
                 f"Re-write <ack_file> with the correct token using <tool_name>.")
             return None
 
-        parts = content.split(":", 1)
-        if len(parts) != 2 or not parts[1].strip():
+        action, sep, raw_name = content.partition(":")
+        if not sep or not raw_name.strip():
             self._dbg(f"MALFORMED ack: {content}")
             self.adapter.surface_prompt('error',
                 f"Malformed ack received: '{content}'. Expected one of: 'work:Task Name', "
                 f"'break', 'extend', or 'end'. Check the format and re-write <ack_file> using <tool_name>.")
             return None
 
-        if parts[0] != "work":
-            self._dbg(f"UNKNOWN action: {parts[0]}")
+        if action != "work":
+            self._dbg(f"UNKNOWN action: {action}")
             self.adapter.surface_prompt('error',
-                f"Unknown ack action '{parts[0]}' in '{content}'. The only prefixed action is "
+                f"Unknown ack action '{action}' in '{content}'. The only prefixed action is "
                 f"'work:Task Name'. Other valid acks are 'break', 'extend', and 'end'. "
                 f"Re-write <ack_file> using <tool_name>.")
             return None
 
-        raw_name = parts[1]
         task_name, task_type = self.find_task(raw_name)
 
         if task_type is None:
-            tasks = self.load_tasks()
-            work_names = [t['name'] for t in tasks.get('work_tasks', [])]
-            fun_names = [t['name'] for t in tasks.get('fun_productive', [])]
-            existing = ', '.join(work_names + fun_names)
+            existing = ', '.join(name for name, _ in self.task_index().values())
             self._dbg(f"UNKNOWN task: {raw_name}")
             self.adapter.surface_prompt('error',
                 f"Task '{raw_name}' is not in tasks.yaml. Existing tasks: [{existing}]. "
@@ -279,6 +490,24 @@ class PomodoroCore:
 
         return {"action": "work", "task_name": task_name, "task_type": task_type}
 
+    def take_ack(self):
+        """Consume the ack file: open, read, unlink. Returns the stripped content,
+        or None if the file is absent or still empty (left in place for the next
+        poll). One open + read instead of exists/getsize/open/read probes."""
+        af = self.config['ACK_FILE']
+        try:
+            fd = os.open(af, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            data = os.read(fd, 4096)  # acks are a single short line
+        finally:
+            os.close(fd)
+        if not data:
+            return None
+        os.unlink(af)
+        return data.decode(errors='replace').strip()
+
     REMINDER_INTERVAL_DEFAULT = 300
 
     async def wait_for_ack(self):
@@ -287,23 +516,31 @@ class PomodoroCore:
         Used only for session_start in the new design (Step 5) — work/break phases
         do their own ack polling inside countdown. Session_start has no timer to
         auto-extend, so the auto-extend-on-overdue block from the old version is gone.
+
+        Sleeps on an inotify watch until the ack file (or session.yaml, which holds
+        the reminder settings) is written, or the next reminder is due. Falls back
+        to POLL_INTERVAL polling where inotify is unavailable.
         """
         af = self.config['ACK_FILE']
-        last_reminder_time = asyncio.get_event_loop().time()
+        watch_names = {os.path.basename(af), os.path.basename(self.config['SESSION_FILE'])}
+        watcher = self.dir_watcher()
+        loop = asyncio.get_running_loop()
+        last_reminder_time = loop.time()
 
         while True:
-            now = asyncio.get_event_loop().time()
+            now = loop.time()
             session = self.load_session()
             reminder_enabled = session.get('reminder_enabled', True)
             reminder_interval = session.get('reminder_interval_minutes', self.REMINDER_INTERVAL_DEFAULT / 60) * 60
+            # A hand-edited 0 (or negative) interval must not spin the loop: at most
+            # one reminder per POLL_INTERVAL, as with the old fixed-rate poll.
+            reminder_interval = max(reminder_interval, self.config['POLL_INTERVAL'])
             if reminder_enabled and now - last_reminder_time >= reminder_interval:
                 self.notify("Pomodoro", "Still waiting for you to start a session!")
                 last_reminder_time = now
 
-            if os.path.exists(af) and os.path.getsize(af) > 0:
-                with open(af, 'r') as f:
-                    content = f.read().strip()
-                os.remove(af)
+            content = self.take_ack()
+            if content is not None:
                 parsed = self.parse_ack(content)
 
                 if parsed is None:
@@ -321,37 +558,58 @@ class PomodoroCore:
                     session["current_task_type"] = parsed["task_type"]
                     if parsed["task_name"] not in session["session_log"]:
                         session["session_log"][parsed["task_name"]] = {"hours": 0, "sessions": 0}
-                    self.save_session(session)
-                    self._dbg(f"Ack: {parsed['task_name']}")
-                else:
-                    self.save_session(session)
-                    self._dbg(f"Ack: {parsed['action']}")
-
-                # Apply meeting-aware durations
-                session = self.load_session()
+                # The session clock starts at the first ack; reset_session nulls it.
+                if not session.get("start_time"):
+                    session["start_time"] = session["last_ack_time"]
                 self.apply_meeting_aware_durations(session)
+                self.save_session(session)
+                self._dbg(f"Ack: {parsed.get('task_name') or parsed['action']}")
 
                 return parsed
-            await asyncio.sleep(self.config['POLL_INTERVAL'])
+
+            timeout = None
+            if reminder_enabled:
+                timeout = max(0, last_reminder_time + reminder_interval - loop.time())
+            await watcher.wait(watch_names, timeout)
 
     # === CHORES/REMINDERS ===
 
     def load_reminders(self):
-        rf = self.config['REMINDERS_FILE']
-        if not os.path.exists(rf):
+        try:
+            data = self._load_yaml_cached(self.config['REMINDERS_FILE']) or {}
+        except FileNotFoundError:
             return []
-        with open(rf, 'r') as f:
-            data = yaml.safe_load(f)
         reminders = data.get('static_reminders') or []
         if self.ensure_ids(reminders):
             self.save_reminders(reminders)
         return [r for r in reminders
                 if self.check_unknown_fields(r, self.REMINDER_KNOWN_FIELDS, 'reminders.yaml')]
 
+    def todays_reminders(self, now):
+        """Reminders that apply today as (due_at, reminder) pairs, sorted by due_at.
+        Rebuilt when the date or reminders.yaml changes, so per-tick callers can
+        stop at the first entry that isn't due yet."""
+        try:
+            st = os.stat(self.config['REMINDERS_FILE'])
+            key = (now.date(), st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            key = (now.date(), None, None)
+        if self._reminder_schedule[0] != key:
+            today = now.strftime('%a').lower()[:3]
+            schedule = []
+            for r in self.load_reminders():
+                days = r.get('days', 'daily')
+                if days != 'daily' and today not in days:
+                    continue
+                h, m = r['time'].split(':')
+                schedule.append((now.replace(hour=int(h), minute=int(m), second=0, microsecond=0), r))
+            schedule.sort(key=lambda entry: entry[0])
+            self._reminder_schedule = (key, schedule)
+        return self._reminder_schedule[1]
+
     def save_reminders(self, reminders):
-        with open(self.config['REMINDERS_FILE'] + '.tmp', 'w') as f:
-            yaml.dump({'static_reminders': reminders}, f, default_flow_style=False)
-        os.rename(self.config['REMINDERS_FILE'] + '.tmp', self.config['REMINDERS_FILE'])
+        self._write_yaml(self.config['REMINDERS_FILE'], {'static_reminders': reminders},
+                         default_flow_style=False)
 
     def cleanup_expired_reminders(self):
         """Drop reminders whose end_date + time is more than 30 min past. Silent."""
@@ -363,19 +621,18 @@ class PomodoroCore:
             return base.replace(hour=int(h), minute=int(m), second=0, microsecond=0)
 
         reminders = self.load_reminders()
-        expired = [r for r in reminders if r.get('end_date') and
-                   (now - reminder_due_dt(r)).total_seconds() > 1800]
+        expired = {r['id'] for r in reminders if r.get('end_date') and
+                   (now - reminder_due_dt(r)).total_seconds() > 1800}
         if expired:
-            active = [r for r in reminders if r not in expired]
+            active = [r for r in reminders if r['id'] not in expired]
             self.save_reminders(active)
             self._dbg(f"  Removed {len(expired)} expired reminder(s).")
 
     def load_chores(self):
-        cf = self.config['CHORE_TIMERS_FILE']
-        if not os.path.exists(cf):
+        try:
+            data = self._load_yaml_cached(self.config['CHORE_TIMERS_FILE']) or {}
+        except FileNotFoundError:
             return []
-        with open(cf, 'r') as f:
-            data = yaml.safe_load(f) or {}
         timers = data.get('chore_timers') or []
         changed = self.ensure_ids(timers)
         valid = []
@@ -398,9 +655,8 @@ class PomodoroCore:
         return valid
 
     def save_chores(self, timers):
-        with open(self.config['CHORE_TIMERS_FILE'] + '.tmp', 'w') as f:
-            yaml.dump({'chore_timers': timers}, f, default_flow_style=False)
-        os.rename(self.config['CHORE_TIMERS_FILE'] + '.tmp', self.config['CHORE_TIMERS_FILE'])
+        self._write_yaml(self.config['CHORE_TIMERS_FILE'], {'chore_timers': timers},
+                         default_flow_style=False)
 
     def clean_chores(self, done=None):
         if done is None:
@@ -415,13 +671,19 @@ class PomodoroCore:
 
     def check_due(self):
         """Check for due chores and reminders."""
+        now = datetime.now()
+        chores = self.load_chores()
+        reminders = self.todays_reminders(now)
+        # Nothing can be due yet: skip the session load entirely.
+        if not chores and (not reminders or now < reminders[0][0]):
+            return []
+
         session = self.load_session()
         done = set(session.get('completed_ids', []))
         ext = session.get('extensions', {})
-        now = datetime.now()
         due = []
 
-        for c in self.load_chores():
+        for c in chores:
             key = f"chore:{c['id']}"
             if key in done:
                 continue
@@ -431,8 +693,9 @@ class PomodoroCore:
             except ValueError:
                 pass
 
-        today = now.strftime('%a').lower()[:3]
-        for r in self.load_reminders():
+        for due_at, r in reminders:
+            if now < due_at:
+                break
             key = f"reminder:{r['id']}"
             if key in done:
                 continue
@@ -443,13 +706,7 @@ class PomodoroCore:
                         continue
                 except ValueError:
                     pass
-            days = r.get('days', 'daily')
-            if days != 'daily' and today not in days:
-                continue
-            h, m = r['time'].split(':')
-            due_at = now.replace(hour=int(h), minute=int(m), second=0, microsecond=0)
-            if now >= due_at:
-                due.append({'id': key, 'name': r['name'], 'type': 'reminder'})
+            due.append({'id': key, 'name': r['name'], 'type': 'reminder'})
 
         return due
 
@@ -573,11 +830,11 @@ class PomodoroCore:
                     f"Meeting '{m.get('name', '?')}' (id={m['id']}) is missing: "
                     f"{', '.join(errors)}. Add the missing fields to the meeting entry in <session_file>.")
                 continue
+            try:
+                start = self.parse_ts(m['start_time'])
+            except ValueError:
+                continue
             for mins in self.config['MEETING_WARNING_THRESHOLDS']:
-                try:
-                    start = self.parse_ts(m['start_time'])
-                except ValueError:
-                    continue
                 due = start - timedelta(minutes=mins)
                 rid = f"mtgrem:{m['id']}:{mins}"
                 existing[rid] = {'id': rid, 'meeting_id': m['id'], 'name': m['name'], 'due_at': self.fmt_ts(due)}
@@ -604,15 +861,15 @@ class PomodoroCore:
 
     def should_end(self, session):
         """Check if should suggest ending."""
-        if self.hours_elapsed(session.get('start_time')) >= session.get('suggest_end_after_hours', self.config['SUGGEST_END_AFTER_HOURS']):
-            return True
         now = datetime.now()
+        if self.hours_elapsed(session.get('start_time'), now) >= session.get('suggest_end_after_hours', self.config['SUGGEST_END_AFTER_HOURS']):
+            return True
         if now.hour + now.minute/60 >= session.get('suggest_end_at_hour', self.config['SUGGEST_END_AT_HOUR']):
             return True
         return False
 
     def apply_meeting_aware_durations(self, session):
-        """Adjust durations based on upcoming meetings."""
+        """Adjust durations based on upcoming meetings. Mutates session; the caller saves."""
         now = datetime.now()
         min_mins = float('inf')
         done = set(session.get('completed_ids', []))
@@ -643,8 +900,6 @@ class PomodoroCore:
             if not session.get('next_work_minutes'):
                 session['next_work_minutes'] = max(5, int((min_mins - self.config['BREAK_MINUTES']) / 2))
 
-        self.save_session(session)
-
     def git_tasks(self, session_log):
         tasks = self.load_tasks()
         all_t = tasks.get('work_tasks', []) + tasks.get('fun_productive', [])
@@ -662,7 +917,11 @@ class PomodoroCore:
         """Run a countdown timer with mid-timer ack file polling and session-yaml
         polling for overrides / extensions / task switches.
 
-        Per-iteration (~1 s):
+        Ticks are scheduled against an absolute deadline on the loop's monotonic
+        clock, so time spent polling files or waiting on the event loop does not
+        accumulate into drift over a 25-minute phase.
+
+        Per-iteration (~1 s, or as soon as the ack file is written):
           - Ack file: read + remove if present. Dispatch via parse_ack (Step 5):
               * extend       - read session.extend_minutes (or EXTEND_MINUTES default),
                                add to remain + total, clear extend_minutes (Step 3b),
@@ -675,7 +934,7 @@ class PomodoroCore:
               * break / end  - if in exit_actions, exit early.
               * unparsable   - parse_ack queues an error prompt; continue.
 
-        Per ten iterations (~10 s):
+        Every 10 s of monotonic time:
           - timer_override_minutes: clamp / reset remaining time. Cleared after use.
           - extend_minutes: add to remain + total. Cleared after use (Step 3b).
             (Mirrors the ack-dispatch path for users who edit session.yaml directly.)
@@ -685,26 +944,41 @@ class PomodoroCore:
         (early_ack is None when the timer expires normally; populated when an
         action in exit_actions arrives mid-timer).
         """
+        loop = asyncio.get_running_loop()
         remain = int(minutes * 60)
         total = remain
-        check = 10
-        count = 0
+        deadline = loop.time() + remain
+        # Session-yaml poll runs on the monotonic clock, not a tick counter, so
+        # ticks that catch up after a stall don't stretch the 10 s interval.
+        check_interval = 10
+        next_check = loop.time() + check_interval
+        session_file = self.config['SESSION_FILE']
+        seen_session_key = None
         switches = []
         switch_start = 0
-        af = self.config['ACK_FILE']
-
+        # Timer line redraw: skip print()'s per-call argument handling.
+        prefix = f"\r{label} "
+        write, flush = sys.stdout.write, sys.stdout.flush
+        # Between ticks, sleep on the shared watcher so an ack is taken as soon as
+        # it is written rather than on the next whole second.
+        watcher = self.dir_watcher()
+        ack_names = {os.path.basename(self.config['ACK_FILE'])}
+
+        drawn = None
         while remain > 0:
-            m, s = divmod(remain, 60)
-            print(f"\r{label} {m:02d}:{s:02d}", end="", flush=True)
+            # Redraw only when the displayed second changes, not on early wakes.
+            if remain != drawn:
+                m, s = divmod(remain, 60)
+                write(f"{prefix}{m:02d}:{s:02d}")
+                flush()
+                drawn = remain
 
             # === ACK FILE POLL (every ~1 s) ===
             # Ordered before the session-poll so 'extend' ack consumes extend_minutes
             # deterministically when both an ack and a YAML edit arrive in the same window.
-            if os.path.exists(af) and os.path.getsize(af) > 0:
-                try:
-                    with open(af, 'r') as f:
-                        content = f.read().strip()
-                    os.remove(af)
+            try:
+                content = self.take_ack()
+                if content is not None:
                     parsed = self.parse_ack(content)
                     if parsed is None:
                         # parse_ack queued an error prompt; keep counting and wait for retry.
@@ -714,6 +988,7 @@ class PomodoroCore:
                         ext = session.get('extend_minutes') or self.config['EXTEND_MINUTES']
                         remain += int(ext * 60)
                         total += int(ext * 60)
+                        deadline += int(ext * 60)
                         session['extend_minutes'] = None  # clear-on-use (Step 3b)
                         session['last_ack_time'] = datetime.now().isoformat()
                         self.save_session(session)
@@ -747,19 +1022,28 @@ class PomodoroCore:
                     elif parsed['action'] == 'break':
                         # 'break' arrived during a break phase (not in exit_actions). No-op.
                         pass
-                except Exception as e:
-                    self._dbg(f"\n  Ack-poll error: {e}")
-
-            await asyncio.sleep(1)
-            remain -= 1
-            count += 1
-            if count >= check:
-                count = 0
+            except Exception as e:
+                self._dbg(f"\n  Ack-poll error: {e}")
+
+            # Sleep until the next whole second before the deadline, or until an ack
+            # lands. min() catches up if the loop stalled past more than one tick
+            # boundary; an early wake keeps the current second.
+            woke = await watcher.wait(ack_names, max(0, deadline - (remain - 1) - loop.time()))
+            remain = max(0, min(remain if woke else remain - 1, math.ceil(deadline - loop.time())))
+            if loop.time() >= next_check:
+                next_check = loop.time() + check_interval
                 try:
+                    # Only look inside session.yaml when it has been written since the
+                    # last poll: a stat instead of a load on the steady-state tick.
+                    st = os.stat(session_file)
+                    session_key = (st.st_mtime_ns, st.st_size)
+                    if session_key == seen_session_key:
+                        continue
                     session = self.load_session()
                     override = session.get('timer_override_minutes')
                     if override is not None:
                         remain = int(override * 60)
+                        deadline = loop.time() + remain
                         if remain == 0:
                             self._dbg("Ended early")
                             self.notify("Pomodoro", "Phase ended early")
@@ -773,6 +1057,7 @@ class PomodoroCore:
                     if ext and ext > 0:
                         remain += int(ext * 60)
                         total += int(ext * 60)
+                        deadline += int(ext * 60)
                         self._dbg(f"Extended +{int(ext)}m")
                         self.notify("Pomodoro", f"Phase extended by {int(ext)} min")
                         session['extend_minutes'] = None
@@ -798,9 +1083,13 @@ class PomodoroCore:
                             print(f"\nSwitch failed: {switch}")
                             self.adapter.surface_prompt('error',
                                 f"Task switch failed: '{switch}' not in tasks.yaml. Check the name and try again.")
+                        drawn = None  # timer line moved below the header; redraw next pass
                         session['task_switch'] = None
                         switch_start = total - remain
                         self.save_session(session)
+                    # Recorded only once every pending change has been applied, so a
+                    # failure above is retried on the next poll.
+                    seen_session_key = session_key
                 except Exception:
                     pass
 
@@ -813,7 +1102,7 @@ class PomodoroCore:
 
     # === WORK ===
 
-    async def work_phase(self, is_fun=False):
+    async def work_phase(self):
         """Run a work timer, then auto-extend with nudges until 'break' or 'end' arrives.
 
         Auto-extend loop semantics (Step 5):
@@ -826,9 +1115,9 @@ class PomodoroCore:
         # Apply meeting-aware durations now that the new phase is starting.
         session = self.load_session()
         self.apply_meeting_aware_durations(session)
-        session = self.load_session()
         started = session.get('last_ack_time') or datetime.now().isoformat()
         task = session.get('current_task')
+        is_fun = session.get('current_task_type') == 'fun'
 
         mins = session.get('next_work_minutes') or self.config['WORK_MINUTES']
         session['next_work_minutes'] = None
@@ -856,13 +1145,17 @@ class PomodoroCore:
         self.process_extensions()
 
         while True:
+            # One load per cycle: nothing below writes session.yaml before the
+            # extend_minutes save, and countdown reloads on its own.
+            session = self.load_session()
+
             # Queue suggest_break (deduped — only if no undelivered one already in queue).
             if not self.adapter.has_undelivered('suggest_break'):
-                session = self.load_session()
                 current_task = session.get('current_task') or task or 'Unknown'
                 elapsed_min = timer_seconds / 60
-                prompt = SUGGEST_BREAK_TEMPLATE.format(elapsed=elapsed_min, task=current_task)
-                prompt += self.due_text(self.check_due(), hard=False)
+                # Optional clauses are collected and joined once.
+                parts = [SUGGEST_BREAK_TEMPLATE.format(elapsed=elapsed_min, task=current_task),
+                         self.due_text(self.check_due(), hard=False)]
 
                 meeting = self.check_meeting()
                 break_mins = session.get('next_break_minutes') or self.config['BREAK_MINUTES']
@@ -870,9 +1163,9 @@ class PomodoroCore:
                     _, name, away = meeting
                     ext = int(away - break_mins)
                     if ext > 0:
-                        prompt += (f"\n\nMeeting '{name}' starts in {int(away)} minutes. "
-                                   f"Suggest extending work by {ext} min for a "
-                                   f"{break_mins}-min break before it.")
+                        parts.append(f"\n\nMeeting '{name}' starts in {int(away)} minutes. "
+                                     f"Suggest extending work by {ext} min for a "
+                                     f"{break_mins}-min break before it.")
                         self.notify("Pomodoro", f"Meeting '{name}' in {int(away)} min!")
 
                 if self.should_end(session) and not self.adapter.has_undelivered('end_session_suggestion'):
@@ -880,13 +1173,12 @@ class PomodoroCore:
                     now_str = datetime.now().strftime('%H:%M')
                     git_info = self.git_tasks(session.get('session_log', {}))
                     git_summary = '; '.join(f"{k}: has_git={v}" for k, v in git_info.items())
-                    prompt += (f"\n\n{END_SESSION_TEMPLATE.format(elapsed=elapsed_h, now=now_str)}"
-                               f" Tasks this session: {git_summary}.")
+                    parts.append(f"\n\n{END_SESSION_TEMPLATE.format(elapsed=elapsed_h, now=now_str)}"
+                                 f" Tasks this session: {git_summary}.")
 
-                self.adapter.surface_prompt('suggest_break', prompt)
+                self.adapter.surface_prompt('suggest_break', ''.join(parts))
 
             # Auto-extend duration. Step 3b: clear extend_minutes on read.
-            session = self.load_session()
             ext_mins = session.get('extend_minutes') or self.config['EXTEND_MINUTES']
             session['extend_minutes'] = None
             self.save_session(session)
@@ -951,7 +1243,6 @@ class PomodoroCore:
         # Apply meeting-aware durations now that the new phase is starting.
         session = self.load_session()
         self.apply_meeting_aware_durations(session)
-        session = self.load_session()
 
         mins = session.get('next_break_minutes') or self.config['BREAK_MINUTES']
         session['next_break_minutes'] = None
@@ -977,7 +1268,6 @@ class PomodoroCore:
         session = self.load_session()
         due = self.check_due()
         session['pending_resolution'] = [item['id'] for item in due]
-        self.save_session(session)
 
         while True:
             # Queue suggest_work (deduped). Re-evaluates due_text each cycle so
@@ -987,10 +1277,14 @@ class PomodoroCore:
                 prompt = SUGGEST_WORK_TEMPLATE + self.due_text(current_due, hard=True)
                 self.adapter.surface_prompt('suggest_work', prompt)
 
-            session = self.load_session()
+            # First cycle reuses the dict carrying pending_resolution so both land
+            # in one save; later cycles follow countdown's writes.
+            if session is None:
+                session = self.load_session()
             ext_mins = session.get('extend_minutes') or self.config['EXTEND_MINUTES']
             session['extend_minutes'] = None  # Step 3b
             self.save_session(session)
+            session = None
 
             self._dbg(f"+{ext_mins}m break (auto-extend, awaiting work/end)")
             self.notify("Pomodoro", f"Break auto-extended by {ext_mins} min — work:Task / end?")
@@ -1057,9 +1351,11 @@ class PomodoroCore:
         completed_chore_ids = {int(x.split(':')[1]) for x in completed_ids if x.startswith('chore:')}
         self.clean_chores(completed_chore_ids)
 
-        af = self.config['ACK_FILE']
-        if os.path.exists(af):
-            os.remove(af)
+        try:
+            os.remove(self.config['ACK_FILE'])
+            self._dbg("  Cleared stale ack file from previous session.")
+        except FileNotFoundError:
+            pass
 
         session = {
             'work_sessions_completed': 0,
@@ -1097,13 +1393,17 @@ class PomodoroCore:
 
     # === MONITOR ===
 
-    async def meeting_monitor(self):
-        session = self.load_session()
-        alerted = set(session.get('startup_alerted', []))
-        if alerted:
-            session['startup_alerted'] = []
-            self.save_session(session)
+    async def meeting_monitor(self, startup_alerted=()):
+        """Surface meeting, chore and reminder prompts as they come due.
+
+        startup_alerted: ids already mentioned in the session_start prompt, so
+        they are not prompted for a second time.
+        """
+        alerted = set(startup_alerted)
         snapshot = {}
+        watcher = self.dir_watcher()
+        watch_names = {os.path.basename(self.config[k])
+                       for k in ('SESSION_FILE', 'CHORE_TIMERS_FILE', 'REMINDERS_FILE')}
 
         while True:
             try:
@@ -1190,25 +1490,20 @@ class PomodoroCore:
                     except ValueError:
                         pass
 
-                today = now.strftime('%a').lower()[:3]
-                for r in self.load_reminders():
+                for due, r in self.todays_reminders(now):
+                    if now < due:
+                        break
                     key = f"reminder:{r['id']}"
                     if key in done or key in alerted:
                         continue
-                    days = r.get('days', 'daily')
-                    if days != 'daily' and today not in days:
-                        continue
-                    h, m = r['time'].split(':')
-                    due = now.replace(hour=int(h), minute=int(m), second=0, microsecond=0)
-                    if now >= due:
-                        alerted.add(key)
-                        self.adapter.surface_prompt('reminder',
-                            f"Reminder '{r['name']}' is now due. "
-                            f"Ask the user if they've done it. "
-                            f"If done: add '{key}' to the completed_ids list in <session_file>. "
-                            f"If deferring: do nothing (fires again next session).")
-                        self.notify("Pomodoro", f"Reminder: {r['name']}")
-                        self._dbg(f"Reminder: {r['name']}")
+                    alerted.add(key)
+                    self.adapter.surface_prompt('reminder',
+                        f"Reminder '{r['name']}' is now due. "
+                        f"Ask the user if they've done it. "
+                        f"If done: add '{key}' to the completed_ids list in <session_file>. "
+                        f"If deferring: do nothing (fires again next session).")
+                    self.notify("Pomodoro", f"Reminder: {r['name']}")
+                    self._dbg(f"Reminder: {r['name']}")
 
                 # Clean expired snoozes
                 session2 = self.load_session()
@@ -1224,16 +1519,14 @@ class PomodoroCore:
             except Exception as e:
                 # Real errors should surface — could indicate a bug worth fixing.
                 print(f"Monitor error: {e}")
-            await asyncio.sleep(30)
+            # Re-check as soon as the agent edits meetings/chores/reminders, else every 30 s
+            # for time-based due checks. Without inotify this is a plain 30 s sleep.
+            await watcher.wait(watch_names, 30, poll=False)
 
     # === MAIN ===
 
     async def run_session(self):
-        # Precondition: notify-send must be available (Step 2c)
-        if not shutil.which('notify-send'):
-            print("Error: notify-send not found.")
-            print("Install libnotify (e.g., 'pacman -S libnotify' on Arch)")
-            return
+        # notify-send availability is checked lazily by _default_notify on first use.
 
         # Preserve un-flushed hours from a previous launch before resetting (Step 2a)
         pre = self.load_session()
@@ -1243,11 +1536,6 @@ class PomodoroCore:
             except (KeyError, FileNotFoundError) as e:
                 print(f"  flush_log warning during startup: {e}")
 
-        # Stale-ack-file warning (debug-gated) — announce before reset_session removes it
-        af = self.config['ACK_FILE']
-        if os.path.exists(af):
-            self._dbg("  Cleared stale ack file from previous session.")
-
         # Standalone startup chore sweep with size-delta print (debug-gated).
         # reset_session calls clean_chores which drops chores >1h past end_time.
         chores_before = len(self.load_chores())
@@ -1269,11 +1557,7 @@ class PomodoroCore:
             [t['name'] for t in tasks.get('work_tasks', [])] +
             [t['name'] for t in tasks.get('fun_productive', [])]
         )
-        session = self.load_session()
         due = self.check_due()
-        if due:
-            session['startup_alerted'] = [item['id'] for item in due]
-            self.save_session(session)
         prompt = (
             f"Pomodoro has started but no ack file was found. "
             f"Ask the user what task they're working on. "
@@ -1290,16 +1574,16 @@ class PomodoroCore:
         print("Waiting...")
         await self.wait_for_ack()
 
-        # Post-ack: set start_time (Step 2b: the dead continuation check is gone — reset_session always nulled it).
+        # wait_for_ack set start_time in the same save as the ack (reset_session always nulls it).
         # suggest_end_after_hours / suggest_end_at_hour are also always set by reset_session, so no fallback needed.
-        session = self.load_session()
-        session['start_time'] = datetime.now().isoformat()
-        self.save_session(session)
 
         # Note: the task header is printed by work_phase at the start of each phase,
         # so we don't print one here. work_phase will pick up current_task and print it.
 
-        monitor_task = asyncio.create_task(self.meeting_monitor())
+        # Items already listed in the session_start prompt are handed to the
+        # monitor in memory so it doesn't prompt for them again.
+        monitor_task = asyncio.create_task(
+            self.meeting_monitor(startup_alerted=[item['id'] for item in due]))
 
         def end_session():
             monitor_task.cancel()
@@ -1311,8 +1595,7 @@ class PomodoroCore:
 
         try:
             while True:
-                is_fun = self.load_session().get('current_task_type') == 'fun'
-                ack = await self.work_phase(is_fun)
+                ack = await self.work_phase()
                 if ack.get("action") == "end":
                     end_session()
                     break
@@ -1330,8 +1613,6 @@ def run(core):
 
 
 if __name__ == "__main__":
-    import sys
-    
     class DefaultAdapter:
         """Default adapter — prints prompts to stdout for manual debugging."""
 
@@ -1344,12 +1625,7 @@ if __name__ == "__main__":
         def clear(self):
             pass
 
-        def notify(self, title, message):
-            try:
-                subprocess.run(['notify-send', '-h', 'string:sound-name:message-new-instant', title, message],
-                             capture_output=True)
-            except Exception:
-                pass
+        # No notify(): PomodoroCore falls back to _default_notify.
     
     base = sys.argv[1] if len(sys.argv) > 1 else None
     if not base:
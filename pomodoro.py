@@ -8,14 +8,17 @@ that points at this clone's adapter directly.
 """
 
 import os
-import subprocess
+import runpy
 import sys
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-ADAPTER_PATH = os.path.join(SCRIPT_DIR, "pomodoro-open", "adapter_claude.py")
+ADAPTER_DIR = os.path.join(SCRIPT_DIR, "pomodoro-open")
+ADAPTER_PATH = os.path.join(ADAPTER_DIR, "adapter_claude.py")
 
 if __name__ == "__main__":
-    sys.exit(subprocess.run(
-        ["python3", ADAPTER_PATH],
-        cwd=os.path.join(SCRIPT_DIR, "pomodoro-open"),
-    ).returncode)
+    # Run the adapter in this interpreter rather than spawning a second python3:
+    # saves a full interpreter start-up and keeps Ctrl+C / exit codes direct.
+    os.chdir(ADAPTER_DIR)
+    sys.path.insert(0, ADAPTER_DIR)
+    sys.argv = [ADAPTER_PATH]
+    runpy.run_path(ADAPTER_PATH, run_name="__main__")